@@ -1,18 +1,19 @@
 const pmtiles = require('pmtiles');
 
+const mimeTypes = {
+  [pmtiles.TileType.Png]: "image/png",
+  [pmtiles.TileType.Jpeg]: "image/jpeg",
+  [pmtiles.TileType.Webp]: "image/webp",
+  [pmtiles.TileType.Avif]: "image/avif",
+  [pmtiles.TileType.Mvt]: "application/vnd.mapbox-vector-tile",
+};
+
 function getMimeType(t) {
-  if (t == pmtiles.TileType.Png) {
-    return "image/png";
-  } else if (t == pmtiles.TileType.Jpeg) {
-    return "image/jpeg";
-  } else if (t == pmtiles.TileType.Webp) {
-    return "image/webp";
-  } else if (t == pmtiles.TileType.Avif) {
-    return "image/avif";
-  } else if (t == pmtiles.TileType.Mvt) {
-    return "application/vnd.mapbox-vector-tile";
+  const mimeType = mimeTypes[t];
+  if (mimeType === undefined) {
+    throw Error(`Unknown tiletype ${t}`);
   }
-  throw Error(`Unknown tiletype ${t}`);
+  return mimeType;
 }
 
 module.exports = {
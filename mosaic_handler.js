@@ -28,6 +28,7 @@ class MosaicHandler {
     this.logger = logger;
     this.pmtilesDict = null;
     this.mimeTypes = null;
+    this.entriesByZoom = null;
   }
 
   _resolveKey(key) {
@@ -42,6 +43,7 @@ class MosaicHandler {
     let data = await res.json();
     this.pmtilesDict = {};
     this.mimeTypes = {};
+    this.entriesByZoom = {};
     for (const [key, entry] of Object.entries(data)) {
       var header = entry.header;
       var resolvedUrl = this._resolveKey(key);
@@ -52,6 +54,12 @@ class MosaicHandler {
       header['maxLon'] = header['max_lon_e7'] / 10000000;
       this.pmtilesDict[key] = { 'pmtiles': archive, 'header': header };
       this.mimeTypes[key] = getMimeType(header.tile_type);
+      for (let z = header.min_zoom; z <= header.max_zoom; z++) {
+        if (!(z in this.entriesByZoom)) {
+          this.entriesByZoom[z] = [];
+        }
+        this.entriesByZoom[z].push({ 'key': key, 'header': header });
+      }
     }
   }
 
@@ -66,14 +74,12 @@ class MosaicHandler {
   _getSourceKey(z, x, y) {
     let k = null;
     const bounds = _getBounds(z, x, y);
-    for (const [key, entry] of Object.entries(this.pmtilesDict)) {
-      if (z > entry.header.max_zoom || z < entry.header.min_zoom) {
-        continue;
-      }
+    const entries = this.entriesByZoom[z] || [];
+    for (const entry of entries) {
       if (!_isInSource(entry.header, bounds)) {
         continue;
       }
-      k = key;
+      k = entry.key;
       break;
     }
     // this.logger.info(`key=${k} for  (${x} ${y} ${z})`);
@@ -145,12 +145,9 @@ async function initializeHandlers() {
   fastify.log.info('initializing handlers');
   const promises = Object.keys(handlerMap).map((k) => {
     logger.info(`initializing ${k}`);
-    try {
-      handlerMap[k].init();
-    }
-    catch(err) {
+    return handlerMap[k].init().catch((err) => {
       console.log(`failed to initialize ${k}, error: ${err}`);
-    }
+    });
   });
   await Promise.all(promises);
   fastify.log.info('done initializing handlers');